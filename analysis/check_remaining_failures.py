@@ -20,8 +20,8 @@ def check_remaining_failures():
     # Check English tests
     print("\n📋 English Test Suite:")
     for i, test_case in enumerate(ENGLISH_TEST_SUITE, 1):
-        text = test_case['text']
-        expected = test_case['ideal_chunks']
+        text = test_case.text
+        expected = list(test_case.ideal_chunks)
         generated = gold_chunker.gold_standard_chunk_text(text)
 
         passes = generated == expected
@@ -29,21 +29,21 @@ def check_remaining_failures():
         if not passes:
             failing_tests.append({
                 'id': i,
-                'name': test_case['name'],
+                'name': test_case.name,
                 'language': 'english',
                 'text': text,
                 'expected': expected,
                 'generated': generated
             })
-            print(f"   ❌ Test {i}: {test_case['name']}")
+            print(f"   ❌ Test {i}: {test_case.name}")
         else:
-            print(f"   ✅ Test {i}: {test_case['name']}")
+            print(f"   ✅ Test {i}: {test_case.name}")
 
     # Check Spanish tests
     print("\n📋 Spanish Test Suite:")
     for i, test_case in enumerate(SPANISH_TEST_SUITE, 1):
-        text = test_case['text']
-        expected = test_case['ideal_chunks']
+        text = test_case.text
+        expected = list(test_case.ideal_chunks)
         generated = gold_chunker.gold_standard_chunk_text(text)
 
         passes = generated == expected
@@ -53,15 +53,15 @@ def check_remaining_failures():
         if not passes:
             failing_tests.append({
                 'id': test_id,
-                'name': test_case['name'],
+                'name': test_case.name,
                 'language': 'spanish',
                 'text': text,
                 'expected': expected,
                 'generated': generated
             })
-            print(f"   ❌ Test {test_id}: {test_case['name']}")
+            print(f"   ❌ Test {test_id}: {test_case.name}")
         else:
-            print(f"   ✅ Test {test_id}: {test_case['name']}")
+            print(f"   ✅ Test {test_id}: {test_case.name}")
 
     print(f"\n📊 SUMMARY")
     print("=" * 60)
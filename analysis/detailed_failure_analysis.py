@@ -23,18 +23,16 @@ def analyze_failing_cases():
     # Combine all test cases
     all_test_cases = []
     for case in ENGLISH_TEST_SUITE:
-        case['language'] = 'english'
-        all_test_cases.append(case)
+        all_test_cases.append(dict(case._asdict(), language='english'))
     for case in SPANISH_TEST_SUITE:
-        case['language'] = 'spanish'
-        all_test_cases.append(case)
+        all_test_cases.append(dict(case._asdict(), language='spanish'))
 
     quality_analyzer = ChunkQualityAnalyzer()
     gold_chunker = GoldStandardChunker()
 
     for i, test_case in enumerate(all_test_cases, 1):
         text = test_case['text']
-        expected = test_case['ideal_chunks']
+        expected = list(test_case['ideal_chunks'])
         language = test_case['language']
 
         # Generate chunks with our algorithm
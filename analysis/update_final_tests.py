@@ -23,8 +23,8 @@ def update_final_failing_tests():
     # Check English tests
     print("\n📋 Checking English Test Suite...")
     for i, test_case in enumerate(ENGLISH_TEST_SUITE, 1):
-        text = test_case['text']
-        expected = test_case['ideal_chunks']
+        text = test_case.text
+        expected = list(test_case.ideal_chunks)
         generated = gold_chunker.gold_standard_chunk_text(text)
 
         if generated != expected:
@@ -32,18 +32,18 @@ def update_final_failing_tests():
                 'suite': 'english',
                 'index': i - 1,  # 0-based index for list
                 'id': i,
-                'name': test_case['name'],
+                'name': test_case.name,
                 'text': text,
                 'old_chunks': expected,
                 'new_chunks': generated
             })
-            print(f"   📍 Will update Test {i}: {test_case['name']}")
+            print(f"   📍 Will update Test {i}: {test_case.name}")
 
     # Check Spanish tests
     print("\n📋 Checking Spanish Test Suite...")
     for i, test_case in enumerate(SPANISH_TEST_SUITE, 1):
-        text = test_case['text']
-        expected = test_case['ideal_chunks']
+        text = test_case.text
+        expected = list(test_case.ideal_chunks)
         generated = gold_chunker.gold_standard_chunk_text(text)
 
         if generated != expected:
@@ -51,12 +51,12 @@ def update_final_failing_tests():
                 'suite': 'spanish',
                 'index': i - 1,  # 0-based index for list
                 'id': i + 20,  # Spanish tests start at 21
-                'name': test_case['name'],
+                'name': test_case.name,
                 'text': text,
                 'old_chunks': expected,
                 'new_chunks': generated
             })
-            print(f"   📍 Will update Test {i + 20}: {test_case['name']}")
+            print(f"   📍 Will update Test {i + 20}: {test_case.name}")
 
     print(f"\n🎯 Found {len(failing_tests)} failing tests to update")
 
@@ -55,13 +55,12 @@ def update_english_tests(superior_chunks):
     updated_tests = []
 
     for test in ENGLISH_TEST_SUITE:
-        if test['id'] in superior_chunks:
+        if test.id in superior_chunks:
             # Update with superior chunks
-            updated_test = test.copy()
-            updated_test['ideal_chunks'] = superior_chunks[test['id']]
+            updated_test = test._replace(ideal_chunks=tuple(superior_chunks[test.id]))
             updated_tests.append(updated_test)
             updated_count += 1
-            print(f"  ✅ Updated Test {test['id']}: {test['name']}")
+            print(f"  ✅ Updated Test {test.id}: {test.name}")
         else:
             # Keep original
             updated_tests.append(test)
@@ -79,13 +78,12 @@ def update_spanish_tests(superior_chunks):
     updated_tests = []
 
     for test in SPANISH_TEST_SUITE:
-        if test['id'] in superior_chunks:
+        if test.id in superior_chunks:
             # Update with superior chunks
-            updated_test = test.copy()
-            updated_test['ideal_chunks'] = superior_chunks[test['id']]
+            updated_test = test._replace(ideal_chunks=tuple(superior_chunks[test.id]))
             updated_tests.append(updated_test)
             updated_count += 1
-            print(f"  ✅ Updated Test {test['id']}: {test['name']}")
+            print(f"  ✅ Updated Test {test.id}: {test.name}")
         else:
             # Keep original
             updated_tests.append(test)
@@ -95,133 +93,58 @@ def update_spanish_tests(superior_chunks):
     print(f"  📊 Updated {updated_count} Spanish tests")
 
 
-def write_updated_english_suite(updated_tests):
-    """Write updated English test suite to file"""
-    content = '''#!/usr/bin/env python3
-"""
-English Test Suite for Chunking Algorithm Evaluation
-Contains 20 diverse test cases with OPTIMIZED ideal chunks
-UPDATED: Gold standard improved with TTS-optimized chunks where superior
-"""
+def quote(value: str) -> str:
+    """Render a string as a double-quoted literal, escaping quotes and backslashes"""
+    return json.dumps(value, ensure_ascii=False)
 
-ENGLISH_TEST_SUITE = [
-'''
 
+def render_suite_entries(updated_tests):
+    """Render test cases in the suite files' _RAW_TEST_SUITE literal layout"""
+    entries = ''
     for i, test in enumerate(updated_tests):
-        content += f'''    {{
-        "id": {test['id']},
-        "name": "{test['name']}",
-        "text": "{test['text']}",
+        entries += f'''    {{
+        "id": {test.id},
+        "name": {quote(test.name)},
+        "text": {quote(test.text)},
         "ideal_chunks": [
 '''
-        for chunk in test['ideal_chunks']:
-            content += f'            "{chunk}",\n'
+        entries += ',\n'.join(f'            {quote(chunk)}' for chunk in test.ideal_chunks) + '\n'
 
-        content += '''        ]
+        entries += '''        ]
     }'''
         if i < len(updated_tests) - 1:
-            content += ','
-        content += '\n'
+            entries += ','
+        entries += '\n'
+    return entries
 
-    content += ''']
 
-def get_test_by_id(test_id: int):
-    """Get a specific test case by ID"""
-    for test in ENGLISH_TEST_SUITE:
-        if test["id"] == test_id:
-            return test
-    return None
+def write_updated_suite(path, updated_tests):
+    """Replace the _RAW_TEST_SUITE literal in a suite file, keeping the module code around it"""
+    with open(path, 'r') as f:
+        current = f.read()
 
-def get_test_by_name(test_name: str):
-    """Get a specific test case by name"""
-    for test in ENGLISH_TEST_SUITE:
-        if test["name"].lower() == test_name.lower():
-            return test
-    return None
-
-if __name__ == "__main__":
-    print("English Test Suite for Chunking Algorithm")
-    print("=" * 50)
-    for test in ENGLISH_TEST_SUITE:
-        print(f"\\n{test['id']}. {test['name']}")
-        print(f"Text: {test['text']}")
-        print("Ideal chunks:")
-        for i, chunk in enumerate(test['ideal_chunks'], 1):
-            print(f"  {i}: {chunk}")
-'''
+    start = current.index('_RAW_TEST_SUITE = [\n')
+    end = current.index('\n]\n', start) + len('\n]\n')
+    content = (current[:start] + '_RAW_TEST_SUITE = [\n'
+               + render_suite_entries(updated_tests) + ']\n' + current[end:])
 
-    # Backup original
+    # Backup current version
     import shutil
-    shutil.copy('test_suite_english.py', 'test_suite_english_original.py')
+    shutil.copy(path, path.replace('.py', '_original.py'))
 
     # Write updated version
-    with open('test_suite_english.py', 'w') as f:
+    with open(path, 'w') as f:
         f.write(content)
 
 
-def write_updated_spanish_suite(updated_tests):
-    """Write updated Spanish test suite to file"""
-    content = '''#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Spanish Test Suite for Chunking Algorithm Evaluation
-Contains 20 diverse test cases with OPTIMIZED ideal chunks
-UPDATED: Gold standard improved with TTS-optimized chunks where superior
-"""
-
-SPANISH_TEST_SUITE = [
-'''
-
-    for i, test in enumerate(updated_tests):
-        content += f'''    {{
-        "id": {test['id']},
-        "name": "{test['name']}",
-        "text": "{test['text']}",
-        "ideal_chunks": [
-'''
-        for chunk in test['ideal_chunks']:
-            content += f'            "{chunk}",\n'
-
-        content += '''        ]
-    }'''
-        if i < len(updated_tests) - 1:
-            content += ','
-        content += '\n'
-
-    content += ''']
-
-def get_test_by_id(test_id: int):
-    """Get a specific test case by ID"""
-    for test in SPANISH_TEST_SUITE:
-        if test["id"] == test_id:
-            return test
-    return None
-
-def get_test_by_name(test_name: str):
-    """Get a specific test case by name"""
-    for test in SPANISH_TEST_SUITE:
-        if test["name"].lower() == test_name.lower():
-            return test
-    return None
-
-if __name__ == "__main__":
-    print("Spanish Test Suite for Chunking Algorithm")
-    print("=" * 50)
-    for test in SPANISH_TEST_SUITE:
-        print(f"\\n{test['id']}. {test['name']}")
-        print(f"Text: {test['text']}")
-        print("Ideal chunks:")
-        for i, chunk in enumerate(test['ideal_chunks'], 1):
-            print(f"  {i}: {chunk}")
-'''
+def write_updated_english_suite(updated_tests):
+    """Write the updated English test suite"""
+    write_updated_suite('test_suite_english.py', updated_tests)
 
-    # Backup original
-    import shutil
-    shutil.copy('test_suite_spanish.py', 'test_suite_spanish_original.py')
 
-    # Write updated version
-    with open('test_suite_spanish.py', 'w') as f:
-        f.write(content)
+def write_updated_spanish_suite(updated_tests):
+    """Write the updated Spanish test suite"""
+    write_updated_suite('test_suite_spanish.py', updated_tests)
 
 
 if __name__ == "__main__":
@@ -51,13 +51,12 @@ def update_english_with_superior_chunks(superior_updates):
     updates_made = 0
 
     for test in ENGLISH_TEST_SUITE:
-        if test['id'] in superior_updates:
+        if test.id in superior_updates:
             # Replace with superior chunks
-            updated_test = test.copy()
-            updated_test['ideal_chunks'] = superior_updates[test['id']]['chunks']
+            updated_test = test._replace(ideal_chunks=tuple(superior_updates[test.id]['chunks']))
             updated_tests.append(updated_test)
             updates_made += 1
-            print(f"📝 ENGLISH: Updated Test {test['id']} with superior chunks")
+            print(f"📝 ENGLISH: Updated Test {test.id} with superior chunks")
         else:
             # Keep original
             updated_tests.append(test)
@@ -75,13 +74,12 @@ def update_spanish_with_superior_chunks(superior_updates):
     updates_made = 0
 
     for test in SPANISH_TEST_SUITE:
-        if test['id'] in superior_updates:
+        if test.id in superior_updates:
             # Replace with superior chunks
-            updated_test = test.copy()
-            updated_test['ideal_chunks'] = superior_updates[test['id']]['chunks']
+            updated_test = test._replace(ideal_chunks=tuple(superior_updates[test.id]['chunks']))
             updated_tests.append(updated_test)
             updates_made += 1
-            print(f"📝 SPANISH: Updated Test {test['id']} with superior chunks")
+            print(f"📝 SPANISH: Updated Test {test.id} with superior chunks")
         else:
             # Keep original
             updated_tests.append(test)
@@ -91,139 +89,58 @@ def update_spanish_with_superior_chunks(superior_updates):
     print(f"✅ Spanish: {updates_made} tests updated with superior chunks")
 
 
-def write_updated_english_suite(updated_tests):
-    """Write the updated English test suite with superior chunks"""
+def quote(value: str) -> str:
+    """Render a string as a double-quoted literal, escaping quotes and backslashes"""
+    return json.dumps(value, ensure_ascii=False)
 
-    content = '''#!/usr/bin/env python3
-"""
-English Test Suite for Chunking Algorithm Evaluation
-Contains 20 diverse test cases with OPTIMIZED ideal chunks
-UPDATED: Inferior gold standards replaced with superior generated chunks
-"""
-
-ENGLISH_TEST_SUITE = [
-'''
 
+def render_suite_entries(updated_tests):
+    """Render test cases in the suite files' _RAW_TEST_SUITE literal layout"""
+    entries = ''
     for i, test in enumerate(updated_tests):
-        content += f'''    {{
-        "id": {test['id']},
-        "name": "{test['name']}",
-        "text": "{test['text']}",
+        entries += f'''    {{
+        "id": {test.id},
+        "name": {quote(test.name)},
+        "text": {quote(test.text)},
         "ideal_chunks": [
 '''
-        for chunk in test['ideal_chunks']:
-            # Escape quotes properly
-            escaped_chunk = chunk.replace('"', '\\"')
-            content += f'            "{escaped_chunk}",\n'
+        entries += ',\n'.join(f'            {quote(chunk)}' for chunk in test.ideal_chunks) + '\n'
 
-        content += '''        ]
+        entries += '''        ]
     }'''
         if i < len(updated_tests) - 1:
-            content += ','
-        content += '\n'
+            entries += ','
+        entries += '\n'
+    return entries
 
-    content += ''']
 
-def get_test_by_id(test_id: int):
-    """Get a specific test case by ID"""
-    for test in ENGLISH_TEST_SUITE:
-        if test["id"] == test_id:
-            return test
-    return None
+def write_updated_suite(path, updated_tests):
+    """Replace the _RAW_TEST_SUITE literal in a suite file, keeping the module code around it"""
+    with open(path, 'r') as f:
+        current = f.read()
 
-def get_test_by_name(test_name: str):
-    """Get a specific test case by name"""
-    for test in ENGLISH_TEST_SUITE:
-        if test["name"].lower() == test_name.lower():
-            return test
-    return None
-
-if __name__ == "__main__":
-    print("English Test Suite for Chunking Algorithm (OPTIMIZED)")
-    print("=" * 60)
-    for test in ENGLISH_TEST_SUITE:
-        print(f"\\n{test['id']}. {test['name']}")
-        print(f"Text: {test['text']}")
-        print("Optimized chunks:")
-        for i, chunk in enumerate(test['ideal_chunks'], 1):
-            print(f"  {i}: {chunk}")
-'''
+    start = current.index('_RAW_TEST_SUITE = [\n')
+    end = current.index('\n]\n', start) + len('\n]\n')
+    content = (current[:start] + '_RAW_TEST_SUITE = [\n'
+               + render_suite_entries(updated_tests) + ']\n' + current[end:])
 
     # Backup current version
     import shutil
-    shutil.copy('test_suite_english.py', 'test_suite_english_before_optimization.py')
+    shutil.copy(path, path.replace('.py', '_before_optimization.py'))
 
-    # Write optimized version
-    with open('test_suite_english.py', 'w') as f:
+    # Write updated version
+    with open(path, 'w') as f:
         f.write(content)
 
 
-def write_updated_spanish_suite(updated_tests):
-    """Write the updated Spanish test suite with superior chunks"""
-
-    content = '''#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Spanish Test Suite for Chunking Algorithm Evaluation
-Contains 20 diverse test cases with OPTIMIZED ideal chunks
-UPDATED: Inferior gold standards replaced with superior generated chunks
-"""
-
-SPANISH_TEST_SUITE = [
-'''
-
-    for i, test in enumerate(updated_tests):
-        content += f'''    {{
-        "id": {test['id']},
-        "name": "{test['name']}",
-        "text": "{test['text']}",
-        "ideal_chunks": [
-'''
-        for chunk in test['ideal_chunks']:
-            # Escape quotes properly
-            escaped_chunk = chunk.replace('"', '\\"')
-            content += f'            "{escaped_chunk}",\n'
-
-        content += '''        ]
-    }'''
-        if i < len(updated_tests) - 1:
-            content += ','
-        content += '\n'
-
-    content += ''']
-
-def get_test_by_id(test_id: int):
-    """Get a specific test case by ID"""
-    for test in SPANISH_TEST_SUITE:
-        if test["id"] == test_id:
-            return test
-    return None
-
-def get_test_by_name(test_name: str):
-    """Get a specific test case by name"""
-    for test in SPANISH_TEST_SUITE:
-        if test["name"].lower() == test_name.lower():
-            return test
-    return None
+def write_updated_english_suite(updated_tests):
+    """Write the updated English test suite"""
+    write_updated_suite('test_suite_english.py', updated_tests)
 
-if __name__ == "__main__":
-    print("Spanish Test Suite for Chunking Algorithm (OPTIMIZED)")
-    print("=" * 60)
-    for test in SPANISH_TEST_SUITE:
-        print(f"\\n{test['id']}. {test['name']}")
-        print(f"Text: {test['text']}")
-        print("Optimized chunks:")
-        for i, chunk in enumerate(test['ideal_chunks'], 1):
-            print(f"  {i}: {chunk}")
-'''
 
-    # Backup current version
-    import shutil
-    shutil.copy('test_suite_spanish.py', 'test_suite_spanish_before_optimization.py')
-
-    # Write optimized version
-    with open('test_suite_spanish.py', 'w') as f:
-        f.write(content)
+def write_updated_spanish_suite(updated_tests):
+    """Write the updated Spanish test suite"""
+    write_updated_suite('test_suite_spanish.py', updated_tests)
 
 
 if __name__ == "__main__":
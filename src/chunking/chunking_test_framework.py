@@ -7,13 +7,13 @@ Comprehensive testing and evaluation system for text chunking algorithms
 
 import sys
 import json
-from typing import List, Dict, Any, Tuple
+from typing import List, Any, Tuple, Sequence
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 import time
 
 # Import test suites
-from test_suite_english import ENGLISH_TEST_SUITE
+from test_suite_english import ENGLISH_TEST_SUITE, TestCase
 from test_suite_spanish import SPANISH_TEST_SUITE
 
 # Import chunking algorithms
@@ -120,7 +120,7 @@ class ChunkingEvaluator:
             failed_tests=failed_tests
         )
 
-    def test_algorithm(self, algorithm, algorithm_name: str, test_suite: List[Dict], language: str) -> List[ChunkingResult]:
+    def test_algorithm(self, algorithm, algorithm_name: str, test_suite: Sequence[TestCase], language: str) -> List[ChunkingResult]:
         """Test an algorithm against a test suite"""
         results = []
 
@@ -128,28 +128,29 @@ class ChunkingEvaluator:
         print("=" * 60)
 
         for test_case in test_suite:
-            print(f"Running test {test_case['id']}: {test_case['name']}")
+            print(f"Running test {test_case.id}: {test_case.name}")
+            ideal_chunks = list(test_case.ideal_chunks)
 
             start_time = time.time()
             try:
                 # Use the correct method name based on algorithm type
                 if hasattr(algorithm, 'natural_chunk_text'):
-                    generated_chunks = algorithm.natural_chunk_text(test_case['text'])
+                    generated_chunks = algorithm.natural_chunk_text(test_case.text)
                 elif hasattr(algorithm, 'tts_chunk_text'):
-                    generated_chunks = algorithm.tts_chunk_text(test_case['text'])
+                    generated_chunks = algorithm.tts_chunk_text(test_case.text)
                 elif hasattr(algorithm, 'gold_standard_chunk_text'):
-                    generated_chunks = algorithm.gold_standard_chunk_text(test_case['text'])
+                    generated_chunks = algorithm.gold_standard_chunk_text(test_case.text)
                 else:
-                    generated_chunks = algorithm.create_chunks(test_case['text'])
+                    generated_chunks = algorithm.create_chunks(test_case.text)
                 execution_time = time.time() - start_time
 
                 result = ChunkingResult(
-                    test_id=test_case['id'],
-                    test_name=test_case['name'],
+                    test_id=test_case.id,
+                    test_name=test_case.name,
                     algorithm_name=algorithm_name,
-                    original_text=test_case['text'],
+                    original_text=test_case.text,
                     generated_chunks=generated_chunks,
-                    ideal_chunks=test_case['ideal_chunks'],
+                    ideal_chunks=ideal_chunks,
                     execution_time=execution_time
                 )
 
@@ -157,7 +158,7 @@ class ChunkingEvaluator:
                 self.results.append(result)
 
                 # Quick feedback
-                if generated_chunks == test_case['ideal_chunks']:
+                if generated_chunks == ideal_chunks:
                     print("  ✅ PASS")
                 else:
                     print("  ❌ FAIL")
@@ -167,12 +168,12 @@ class ChunkingEvaluator:
                 execution_time = time.time() - start_time
 
                 result = ChunkingResult(
-                    test_id=test_case['id'],
-                    test_name=test_case['name'],
+                    test_id=test_case.id,
+                    test_name=test_case.name,
                     algorithm_name=algorithm_name,
-                    original_text=test_case['text'],
+                    original_text=test_case.text,
                     generated_chunks=[],
-                    ideal_chunks=test_case['ideal_chunks'],
+                    ideal_chunks=ideal_chunks,
                     execution_time=execution_time
                 )
 
@@ -270,7 +271,7 @@ class ChunkingEvaluator:
                 algorithms[key] = {'english': [], 'spanish': []}
 
             # Determine language based on test_id patterns or content
-            if any(test['id'] == result.test_id for test in ENGLISH_TEST_SUITE):
+            if any(test.id == result.test_id for test in ENGLISH_TEST_SUITE):
                 algorithms[key]['english'].append(result)
             else:
                 algorithms[key]['spanish'].append(result)
@@ -12,6 +12,13 @@ Addresses critical issues: empty chunks, abbreviation spacing, sentence boundari
 import re
 from typing import List, Dict, Tuple
 
+# Sentence punctuation (including Spanish opening marks). For counting or
+# detecting these in a chunk, use str.translate / set membership below rather
+# than re.findall(r'[.!?¿¡]', ...) - both stay in a single C-level pass.
+_PUNCT_CHARS = '.!?¿¡'
+_PUNCT_TABLE = str.maketrans('', '', _PUNCT_CHARS)
+_PUNCT_SET = frozenset(_PUNCT_CHARS)
+
 
 class GoldStandardChunker:
     """
@@ -416,14 +423,14 @@ def test_gold_standard_vs_existing():
 
     # Test on first 5 test cases
     for test in ENGLISH_TEST_SUITE[:5]:
-        print(f"\n📋 Test: {test['name']}")
-        print(f"Text: {test['text']}")
+        print(f"\n📋 Test: {test.name}")
+        print(f"Text: {test.text}")
 
         # Gold standard results
-        gold_chunks = gold_chunker.gold_standard_chunk_text(test['text'])
+        gold_chunks = gold_chunker.gold_standard_chunk_text(test.text)
 
         # Expected ideal chunks
-        ideal_chunks = test['ideal_chunks']
+        ideal_chunks = list(test.ideal_chunks)
 
         print(f"\nIdeal ({len(ideal_chunks)} chunks):")
         for i, chunk in enumerate(ideal_chunks, 1):
@@ -238,7 +238,7 @@ class GnomeReaderControl(dbus.service.Object):
                 cmd.extend(['--action', action])
 
             # Execute notification
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
             if result.returncode == 0:
                 print(f"📱 Updated notification: {progress_pct}% - {status_text}")
@@ -257,7 +257,7 @@ class GnomeReaderControl(dbus.service.Object):
                 '--hint=boolean:transient:true',
                 '✅ Reading Complete',
                 f'Finished reading: {title}'
-            ], capture_output=True)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
         except Exception as e:
             print(f"❌ Completion notification error: {e}")
@@ -19,7 +19,7 @@ from smart_chunking import ProgressiveContentFetcher
 from enhanced_chunking import NaturalSpeechChunker
 from tts_optimized_chunking import TTSOptimizedChunker
 from gold_standard_chunker import GoldStandardChunker
-from simple_parallel import SimpleParallelTTS
+from simple_parallel import SimpleParallelTTS, setup_console_logging
 
 class EarlyStartPlayer:
     """Play audio as soon as first chunks are ready"""
@@ -37,6 +37,8 @@ class EarlyStartPlayer:
         self.audio_queue = queue.Queue()
         self.playing = False
         self.stopped = False
+        # TTS processors that own the queued audio files; see close()
+        self._processors = []
 
         # Statistics
         self.stats = {
@@ -67,7 +69,10 @@ class EarlyStartPlayer:
 
         # Process first batch immediately
         immediate_processor = SimpleParallelTTS(max_workers=1)
+        self._processors.append(immediate_processor)
         immediate_audio_files = immediate_processor.process_chunks_parallel(immediate_chunks)
+        # Its files are still to be played, but its loaded model is no longer needed
+        immediate_processor.stop_workers()
 
         # Record time to first audio
         first_audio_time = time.time()
@@ -83,9 +88,9 @@ class EarlyStartPlayer:
         )
         playback_thread.start()
 
-        # Queue immediate audio files
+        # Queue immediate audio files with the processor that owns them
         for _, audio_file in immediate_audio_files:
-            self.audio_queue.put(audio_file)
+            self.audio_queue.put((immediate_processor, audio_file))
 
         # Start background processing if there are remaining chunks
         background_thread = None
@@ -110,12 +115,14 @@ class EarlyStartPlayer:
 
         while self.playing and not self.stopped:
             try:
-                audio_file = self.audio_queue.get(timeout=10)
+                item = self.audio_queue.get(timeout=10)
 
-                if audio_file is None:  # End signal
+                if item is None:  # End signal
                     print("✅ All audio chunks completed")
                     break
 
+                processor, audio_file = item
+
                 chunk_start = time.time()
                 success = self._play_audio_file(audio_file)
 
@@ -127,8 +134,8 @@ class EarlyStartPlayer:
                     self.stats['playback_errors'] += 1
                     print(f"  ❌ Failed to play {os.path.basename(audio_file)}")
 
-                # Cleanup audio file
-                self._cleanup_audio_file(audio_file)
+                # Hand the output slot back for reuse
+                self._cleanup_audio_file(processor, audio_file)
 
             except queue.Empty:
                 if not self.playing:
@@ -189,13 +196,14 @@ class EarlyStartPlayer:
         try:
             # Use multiple workers for background processing
             background_processor = SimpleParallelTTS(max_workers=3)
+            self._processors.append(background_processor)
             audio_files = background_processor.process_chunks_parallel(remaining_chunks)
 
             print(f"🔄 Background processing completed: {len(audio_files)} chunks ready")
 
             # Queue background audio files
             for _, audio_file in audio_files:
-                self.audio_queue.put(audio_file)
+                self.audio_queue.put((background_processor, audio_file))
 
         except Exception as e:
             logging.error(f"Background processing error: {e}")
@@ -203,13 +211,20 @@ class EarlyStartPlayer:
             # Signal end of queue
             self.audio_queue.put(None)
 
-    def _cleanup_audio_file(self, audio_file: str):
-        """Clean up temporary audio file"""
-        try:
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-        except Exception as e:
-            logging.warning(f"Failed to cleanup {audio_file}: {e}")
+    def _cleanup_audio_file(self, processor: SimpleParallelTTS, audio_file: str):
+        """Delete a played audio file via the processor that owns it"""
+        processor.release(audio_file)
+
+    def close(self):
+        """
+        Shut down the TTS processors and remove their output directories
+
+        Call only after the playback and background threads returned by
+        start_early_playback() have been joined.
+        """
+        for processor in self._processors:
+            processor.close()
+        self._processors = []
 
     def stop(self):
         """Stop playback"""
@@ -220,9 +235,9 @@ class EarlyStartPlayer:
         # Clear remaining queue
         try:
             while True:
-                audio_file = self.audio_queue.get_nowait()
-                if audio_file:
-                    self._cleanup_audio_file(audio_file)
+                item = self.audio_queue.get_nowait()
+                if item:
+                    self._cleanup_audio_file(*item)
         except queue.Empty:
             pass
 
@@ -269,6 +284,7 @@ class MVPProgressiveStreaming:
             Dictionary with performance statistics
         """
         overall_start = time.time()
+        playback_thread = background_thread = None
 
         try:
             print(f"🎯 MVP Progressive Streaming: {source}")
@@ -321,10 +337,7 @@ class MVPProgressiveStreaming:
 
             # 3. Wait for completion
             print("⏳ Waiting for playback completion...")
-            playback_thread.join()
-
-            if background_thread:
-                background_thread.join()
+            self._join(playback_thread, background_thread)
 
             # 4. Collect statistics
             player_stats = self.player.get_stats()
@@ -347,6 +360,18 @@ class MVPProgressiveStreaming:
             logging.error(f"MVP streaming error: {e}")
             return self.stats
 
+        finally:
+            # Processors may only be closed once no thread is still using them
+            self._join(playback_thread, background_thread)
+            self.player.close()
+
+    @staticmethod
+    def _join(*threads: Optional[threading.Thread]):
+        """Wait for every started thread"""
+        for thread in threads:
+            if thread is not None:
+                thread.join()
+
     def _display_results(self):
         """Display performance results"""
         print("\n" + "=" * 60)
@@ -429,6 +454,7 @@ def benchmark_mvp_vs_current():
 if __name__ == "__main__":
     # Set up logging
     logging.basicConfig(level=logging.INFO)
+    setup_console_logging()
 
     # Run MVP benchmark
     benchmark_mvp_vs_current()
\ No newline at end of file
@@ -17,9 +17,12 @@ Examples:
   uv run src/tts/say_read.py -l es -v ef_dora --player ffplay https://elpais.com/tecnologia/
   uv run src/tts/say_read.py -o /tmp/article.mp3 https://www.bbc.com/news/technology
   lynx -dump -nolist URL | head -c 5000 | uv run src/tts/say_read.py --player ffplay -  # stdin
+  uv run src/tts/say_read.py --server  # JSON jobs on stdin: {"text": ..., "out": ...}
+  uv run src/tts/say_read.py --batch jobs.json  # JSON list of jobs, one process
+  uv run src/tts/say_read.py --stdout URL | ffplay -f s16le -ar 24000 -ac 1 -nodisp -autoexit -  # raw PCM pipe
 """
 
-import argparse, os, re, sys, shutil, tempfile, subprocess, unicodedata, time
+import argparse, json, os, re, sys, shutil, tempfile, subprocess, unicodedata, time
 from pathlib import Path
 
 # Version information
@@ -242,6 +245,10 @@ def synth_retry(k: Kokoro, text: str, voice: str | None, lang: str, debug: bool,
             audio.append(x)
         return np.concatenate(audio), sr, True, total_time
 
+def pcm16(arr: np.ndarray) -> bytes:
+    # float [-1, 1] -> raw little-endian s16 samples
+    return (np.clip(arr, -1.0, 1.0) * 32767.0).astype('<i2').tobytes()
+
 def write_audio(arr: np.ndarray, sr: int, out: str):
     out_path = Path(out)
     if out_path.suffix.lower() == '.wav':
@@ -315,7 +322,7 @@ def stream_fast(k, pieces, voice, lang, debug):
         for i, p in enumerate(pieces, 1):
             a, sr, did_split, dt = synth_retry(k, p, voice, lang, debug)
             total_t += dt
-            pcm = (np.clip(a, -1.0, 1.0) * 32767.0).astype('<i2').tobytes()
+            pcm = pcm16(a)
             if proc.stdin is None:
                 break
             try:
@@ -333,11 +340,73 @@ def stream_fast(k, pieces, voice, lang, debug):
     return True
 
 
+def synth_text(k, text: str, voice, lang: str, chunk: int, debug: bool):
+    # Clean, split and synthesize a whole text into one buffer
+    pieces = split_sentences(clean_text(text), chunk)
+    if not pieces:
+        raise ValueError("no text to synthesize")
+    audio_list, sr = [], None
+    for p in pieces:
+        a, sr, _, _ = synth_retry(k, p, voice, lang, debug)
+        audio_list.append(a)
+    return np.concatenate(audio_list), sr
+
+def run_job(k, voice, args, job: dict) -> dict:
+    # Synthesize one {"text": ..., "out": ...} job and report the outcome
+    try:
+        wav, sr = synth_text(k, job['text'], voice, args.lang, args.chunk, args.debug)
+        write_audio(wav, sr, job['out'])
+        return {"ok": True, "out": job['out']}
+    except Exception as e:
+        dbg(f"[say-read] job failed: {e}", args.debug)
+        return {"ok": False, "error": str(e)}
+
+def reserve_stdout(binary=False):
+    # Keep fd 1 for protocol replies (or raw PCM) only. Anything else that would
+    # write to stdout (library prints, ffmpeg children inheriting fd 1) goes to stderr.
+    if binary:
+        reply = os.fdopen(os.dup(1), 'wb')
+    else:
+        reply = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return reply
+
+def serve(k, voice, args, reply_out):
+    # Keep the model loaded and answer one JSON job per stdin line.
+    # Each job is {"text": ..., "out": ...}; one JSON status line is written
+    # back on reply_out. EOF (or an empty line) ends the session.
+    while True:
+        line = sys.stdin.readline()
+        if not line.strip():
+            break
+        try:
+            reply = run_job(k, voice, args, json.loads(line))
+        except ValueError as e:
+            reply = {"ok": False, "error": str(e)}
+        reply_out.write(json.dumps(reply) + "\n")
+        reply_out.flush()
+    return 0
+
+def run_batch(k, voice, args, reply_out):
+    # Synthesize a JSON list of jobs in one process; write a JSON list of replies
+    with open(args.batch, encoding='utf-8') as f:
+        jobs = json.load(f)
+    replies = []
+    for i, job in enumerate(jobs, 1):
+        replies.append(run_job(k, voice, args, job))
+        if args.debug:
+            dbg(f"[say-read] [batch {i}/{len(jobs)}] ok={replies[-1]['ok']}", True)
+    reply_out.write(json.dumps(replies) + "\n")
+    reply_out.flush()
+    return 0
+
+
 # ======================== main ========================
 
 def main():
     ap = argparse.ArgumentParser(description="Read a URL/FILE/TXT with kokoro-onnx (offline).")
-    ap.add_argument('source', help="URL | /path/file | - (stdin)")
+    ap.add_argument('source', nargs='?', help="URL | /path/file | - (stdin)")
     ap.add_argument('-l','--lang', default=os.environ.get('KOKORO_LANG','en-us'), help='language code (e.g., en-us, es, fr)')
     ap.add_argument('-v','--voice', default=os.environ.get('KOKORO_VOICE',''), help='voice id (e.g., af_heart, ef_dora)')
     ap.add_argument('-c','--chunk', type=int, default=320, help='target characters per piece (lower is safer)')
@@ -349,10 +418,32 @@ def main():
     ap.add_argument('--max-chars', type=int, default=int(os.environ.get('SAYREAD_MAXCHARS','0')), help='truncate text to this many chars before reading')
     ap.add_argument('--stream', action='store_true', help='play each piece as soon as it is synthesized')
     ap.add_argument('--stream-fast', action='store_true', help='low-latency streaming via one ffplay process')
+    ap.add_argument('--stdout', action='store_true', help='write raw s16le mono 24 kHz PCM to stdout, piece by piece')
     ap.add_argument('--trim-silence', action='store_true', help='remove leading/trailing silence in playback/output')
+    ap.add_argument('--server', action='store_true', help='keep the model loaded and synthesize JSON jobs read from stdin')
+    ap.add_argument('--batch', metavar='JOBS_JSON', help='synthesize a JSON list of {"text", "out"} jobs in one process')
     ap.add_argument('-d','--debug', action='store_true')
     args = ap.parse_args()
 
+    if args.server or args.batch:
+        # Reserve stdout before loading the model so nothing can corrupt the replies
+        reply_out = reserve_stdout()
+        k = Kokoro(args.model, args.voices)
+        voice = args.voice or ('ef_dora' if args.lang.lower().startswith('es') else 'af_heart')
+        if args.server:
+            return serve(k, voice, args, reply_out)
+        return run_batch(k, voice, args, reply_out)
+    if args.source is None:
+        ap.error("the following arguments are required: source")
+    if args.stdout:
+        clash = [flag for flag, on in (('-o/--out', args.out), ('--stream', args.stream),
+                                       ('--stream-fast', args.stream_fast),
+                                       ('--trim-silence', args.trim_silence)) if on]
+        if clash:
+            ap.error(f"--stdout cannot be combined with {', '.join(clash)}")
+        # Reserve stdout before extraction and model loading so only PCM reaches the pipe
+        pcm_out = reserve_stdout(binary=True)
+
     raw = extract_input(args.source, args.render, args.debug)
     text = clean_text(raw)
 
@@ -378,6 +469,27 @@ def main():
 
     player = args.player or next((p for p in ('ffplay','mpv','paplay','aplay') if shutil.which(p)), None)
 
+    # Pipe path: raw PCM to stdout as each piece is ready, no files at all
+    if args.stdout:
+        total_t = 0.0
+        for i, p in enumerate(pieces, 1):
+            a, sr, did_split, dt = synth_retry(k, p, voice, args.lang, args.debug)
+            total_t += dt
+            try:
+                pcm_out.write(pcm16(a))
+                pcm_out.flush()
+            except BrokenPipeError:
+                dbg("[say-read] stdout closed early", args.debug)
+                # Drop whatever is still buffered; the reader is gone
+                try:
+                    pcm_out.close()
+                except BrokenPipeError:
+                    pass
+                break
+            if args.debug:
+                dbg(f"[say-read] [pipe {i}/{len(pieces)}] len={len(p)} split={did_split} synth={dt:.2f}s total={total_t:.2f}s", True)
+        return 0
+
     # Fast stream path: one ffplay process, raw PCM
     if args.stream_fast and not args.out:
         ok = stream_fast(k, pieces, voice, args.lang, args.debug)
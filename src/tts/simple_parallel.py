@@ -9,14 +9,48 @@ Basic parallelization to validate performance assumptions
 """
 
 import threading
+import itertools
 import queue
 import subprocess
+import select
+import json
 import os
 import time
 import tempfile
+import shutil
+import sys
 import logging
 from typing import List, Tuple, Optional
 
+# TTS interpreter and script, resolved once for every processor
+_TTS_PYTHON = os.path.expanduser("~/.venvs/tts/bin/python")
+_SAY_READ_SCRIPT = os.path.join(os.path.dirname(__file__), "say_read.py")
+
+log = logging.getLogger(__name__)
+_console_logging_lock = threading.Lock()
+
+def setup_console_logging():
+    """
+    Print this module's progress messages the way a script expects
+
+    Info messages go to stdout and warnings/errors to stderr, written
+    synchronously so they stay in order with the caller's own prints.
+    Applications that configure logging themselves should not call this.
+    """
+    with _console_logging_lock:
+        if log.handlers:
+            return
+        formatter = logging.Formatter("%(message)s")
+        out_handler = logging.StreamHandler(sys.stdout)
+        out_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+        err_handler = logging.StreamHandler(sys.stderr)
+        err_handler.setLevel(logging.WARNING)
+        for handler in (out_handler, err_handler):
+            handler.setFormatter(formatter)
+            log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+
 class SimpleParallelTTS:
     """Basic parallel TTS processing - no complex audio pipeline"""
 
@@ -30,8 +64,17 @@ class SimpleParallelTTS:
         """
         self.max_workers = max_workers
         self.tts_timeout = tts_timeout
-        self.tts_python = os.path.expanduser("~/.venvs/tts/bin/python")
-        self.say_read_script = os.path.join(os.path.dirname(__file__), "say_read.py")
+        self.tts_python = _TTS_PYTHON
+        self.say_read_script = _SAY_READ_SCRIPT
+
+        # Private output directory: names only need to be unique within it,
+        # and close() removes everything with one rmtree
+        self._tmpdir = tempfile.mkdtemp(prefix="tts_parallel_")
+        self._seq = itertools.count()
+
+        # Output (file name, path) slots: created on demand, and reused once
+        # their audio has been consumed and handed back via release()
+        self._free_slots = queue.Queue()
 
         # Thread-safe structures
         self.text_queue = queue.Queue()
@@ -45,6 +88,81 @@ class SimpleParallelTTS:
             'average_time_per_chunk': 0
         }
 
+        # Persistent say_read.py servers: the model is loaded once per worker
+        self._workers = [self._start_worker() for _ in range(max_workers)]
+
+    def _start_worker(self) -> Optional[subprocess.Popen]:
+        """Launch one say_read.py process in server mode"""
+        cmd = [self.tts_python, self.say_read_script, "--server"]
+        try:
+            return subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                bufsize=0
+            )
+        except OSError as e:
+            log.error(f"Failed to start TTS server: {e}")
+            return None
+
+    def _new_slot(self) -> Tuple[str, str]:
+        """Build a fresh (file name, path) output slot"""
+        basename = f"slot_{next(self._seq)}.wav"
+        return basename, os.path.join(self._tmpdir, basename)
+
+    def _acquire_slot(self) -> Tuple[str, str]:
+        """Take a released output slot, or a new one when none is free"""
+        try:
+            return self._free_slots.get_nowait()
+        except queue.Empty:
+            return self._new_slot()
+
+    def release(self, audio_file: str):
+        """Delete a consumed (or failed) audio file and return its name for reuse"""
+        try:
+            os.remove(audio_file)
+        except FileNotFoundError:
+            pass
+        self._free_slots.put((os.path.basename(audio_file), audio_file))
+
+    def _restart_worker(self, worker_index: int) -> Optional[subprocess.Popen]:
+        """Reap a crashed, stuck or stopped TTS server and start a replacement"""
+        proc = self._workers[worker_index]
+        if proc is not None:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            for pipe in (proc.stdin, proc.stdout):
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+        self._workers[worker_index] = self._start_worker()
+        return self._workers[worker_index]
+
+    def stop_workers(self):
+        """
+        Shut down the persistent TTS servers, keeping the generated audio files
+
+        Servers are started again on demand if more chunks are processed.
+        """
+        for proc in self._workers:
+            if proc is None:
+                continue
+            try:
+                proc.stdin.close()  # EOF ends the server loop
+                proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+        self._workers = [None] * len(self._workers)
+
+    def close(self):
+        """Shut down the persistent TTS servers and remove the output directory"""
+        self.stop_workers()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
     def process_chunks_parallel(self, text_chunks: List[str]) -> List[Tuple[int, str]]:
         """
         Process multiple text chunks in parallel
@@ -55,11 +173,12 @@ class SimpleParallelTTS:
         Returns:
             List of (index, audio_file_path) tuples, sorted by original order
         """
-        print(f"🔄 Starting parallel TTS processing for {len(text_chunks)} chunks")
+        log.info(f"🔄 Starting parallel TTS processing for {len(text_chunks)} chunks")
         start_time = time.time()
 
         self.processing_stats['total_chunks'] = len(text_chunks)
-        audio_files = []
+        # One slot per chunk index, so results land in order without a sort
+        audio_paths: List[Optional[str]] = [None] * len(text_chunks)
 
         # Determine optimal worker count
         actual_workers = min(self.max_workers, len(text_chunks))
@@ -69,6 +188,7 @@ class SimpleParallelTTS:
         for i in range(actual_workers):
             worker = threading.Thread(
                 target=self._tts_worker,
+                args=(i,),
                 name=f"TTSWorker-{i+1}"
             )
             worker.start()
@@ -82,25 +202,28 @@ class SimpleParallelTTS:
         for _ in range(actual_workers):
             self.text_queue.put(None)
 
-        # Collect results
+        # Collect results: every dequeue counts, failed chunks arrive as None
         results_collected = 0
+        failed_collected = 0
         while results_collected < len(text_chunks):
             try:
                 result = self.result_queue.get(timeout=self.tts_timeout + 5)
+                results_collected += 1
                 if result is not None:
-                    audio_files.append(result)
-                    results_collected += 1
-                    print(f"  ✅ Completed chunk {results_collected}/{len(text_chunks)}")
+                    audio_paths[result[0]] = result[1]
+                    log.info(f"  ✅ Completed chunk {results_collected}/{len(text_chunks)}")
+                else:
+                    failed_collected += 1
+                    log.error(f"  ❌ Failed chunk {results_collected}/{len(text_chunks)} ({failed_collected} failed so far)")
             except queue.Empty:
-                logging.error("Timeout waiting for TTS results")
+                log.error("Timeout waiting for TTS results")
                 break
 
         # Wait for all workers to complete
         for worker in workers:
             worker.join(timeout=5)
 
-        # Sort results by original order
-        audio_files.sort(key=lambda x: x[0])
+        audio_files = [(i, path) for i, path in enumerate(audio_paths) if path is not None]
 
         # Update statistics
         total_time = time.time() - start_time
@@ -111,49 +234,49 @@ class SimpleParallelTTS:
         if len(audio_files) > 0:
             self.processing_stats['average_time_per_chunk'] = total_time / len(audio_files)
 
-        print(f"⚡ Parallel processing complete: {len(audio_files)}/{len(text_chunks)} chunks in {total_time:.1f}s")
+        log.info(f"⚡ Parallel processing complete: {len(audio_files)}/{len(text_chunks)} chunks in {total_time:.1f}s")
 
         return audio_files
 
-    def _tts_worker(self):
-        """Worker thread for TTS processing"""
+    def _tts_worker(self, worker_index: int):
+        """Worker thread for TTS processing, bound to one TTS server"""
         worker_name = threading.current_thread().name
 
         while True:
-            try:
-                item = self.text_queue.get(timeout=1)
+            # Block until work arrives; the None sentinel ends the loop
+            item = self.text_queue.get()
 
-                if item is None:  # Shutdown signal
-                    break
+            if item is None:  # Shutdown signal
+                break
 
+            try:
                 chunk_index, text = item
-                print(f"  🎤 {worker_name}: Processing chunk {chunk_index+1}")
+                log.info(f"  🎤 {worker_name}: Processing chunk {chunk_index+1}")
 
                 # Generate audio file
-                audio_file = self._generate_audio_file(chunk_index, text, worker_name)
+                audio_file = self._generate_audio_file(worker_index, chunk_index, text, worker_name)
 
                 if audio_file:
                     self.result_queue.put((chunk_index, audio_file))
                 else:
                     self.error_count += 1
-                    logging.error(f"{worker_name}: Failed to generate audio for chunk {chunk_index}")
+                    log.error(f"{worker_name}: Failed to generate audio for chunk {chunk_index}")
                     self.result_queue.put(None)  # Signal failed chunk
 
-                self.text_queue.task_done()
-
-            except queue.Empty:
-                continue
             except Exception as e:
-                logging.error(f"{worker_name}: Worker error: {e}")
+                log.error(f"{worker_name}: Worker error: {e}")
                 self.result_queue.put(None)
+            finally:
+                self.text_queue.task_done()
 
-        print(f"  👋 {worker_name}: Finished")
+        log.info(f"  👋 {worker_name}: Finished")
 
-    def _generate_audio_file(self, chunk_index: int, text: str, worker_name: str) -> Optional[str]:
+    def _generate_audio_file(self, worker_index: int, chunk_index: int, text: str, worker_name: str) -> Optional[str]:
         """
         Generate audio file for a single text chunk
 
         Args:
+            worker_index: Index of the TTS server owned by the calling thread
             chunk_index: Index of the chunk for ordering
             text: Text to convert to speech
             worker_name: Name of worker thread (for logging)
@@ -161,51 +284,67 @@ class SimpleParallelTTS:
         Returns:
             Path to generated audio file, or None if failed
         """
-        # Create unique temporary file
-        temp_dir = tempfile.gettempdir()
-        audio_file = os.path.join(
-            temp_dir,
-            f"mvp_chunk_{chunk_index}_{os.getpid()}_{int(time.time())}.wav"
-        )
-
-        # Prepare TTS command
-        cmd = [
-            self.tts_python,
-            self.say_read_script,
-            "-o", audio_file,
-            "-"  # Read from stdin
-        ]
+        proc = self._workers[worker_index]
+        if proc is None or proc.poll() is not None:
+            # Stopped, or exited between jobs: this chunk can still go to a fresh server
+            proc = self._restart_worker(worker_index)
+            if proc is None:
+                log.error(f"    ❌ {worker_name}: TTS server not running for chunk {chunk_index}")
+                return None
+
+        # Reuse a pooled output path
+        basename, audio_file = self._acquire_slot()
+
+        request = json.dumps({"text": text, "out": audio_file}) + "\n"
 
         try:
             start_time = time.time()
 
-            # Execute TTS command
-            result = subprocess.run(
-                cmd,
-                input=text,
-                text=True,
-                capture_output=True,
-                timeout=self.tts_timeout
-            )
+            # Hand the chunk to the already-loaded TTS server
+            proc.stdin.write(request.encode('utf-8'))
+            ready, _, _ = select.select([proc.stdout], [], [], self.tts_timeout)
+            if not ready:
+                raise subprocess.TimeoutExpired(proc.args, self.tts_timeout)
+            line = proc.stdout.readline()
+            if not line:
+                raise EOFError("TTS server exited")
+            reply = json.loads(line)
 
             generation_time = time.time() - start_time
 
-            if result.returncode == 0 and os.path.exists(audio_file):
-                file_size = os.path.getsize(audio_file)
-                print(f"    ✅ {worker_name}: Generated {os.path.basename(audio_file)} "
+            file_size = None
+            if reply.get('ok'):
+                try:
+                    file_size = os.stat(audio_file).st_size
+                except FileNotFoundError:
+                    pass
+
+            if file_size is not None:
+                log.info(f"    ✅ {worker_name}: Generated {basename} "
                       f"({file_size} bytes) in {generation_time:.1f}s")
                 return audio_file
             else:
-                print(f"    ❌ {worker_name}: TTS failed for chunk {chunk_index}")
-                if result.stderr:
-                    print(f"       Error: {result.stderr}")
+                log.error(f"    ❌ {worker_name}: TTS failed for chunk {chunk_index}")
+                if reply.get('error'):
+                    log.error(f"       Error: {reply['error']}")
+                self.release(audio_file)
                 return None
 
         except subprocess.TimeoutExpired:
-            print(f"    ⏰ {worker_name}: TTS timeout for chunk {chunk_index}")
+            log.warning(f"    ⏰ {worker_name}: TTS timeout for chunk {chunk_index}")
+            # The server is stuck mid-job; replace it so later chunks can proceed
+            self._restart_worker(worker_index)
+            self.release(audio_file)
+            return None
+        except (EOFError, BrokenPipeError) as e:
+            log.error(f"    💥 {worker_name}: TTS server crashed on chunk {chunk_index}: {e}")
+            # Only this chunk is lost; later chunks go to a replacement server
+            self._restart_worker(worker_index)
+            self.release(audio_file)
             return None
         except Exception as e:
-            print(f"    💥 {worker_name}: TTS exception for chunk {chunk_index}: {e}")
+            log.error(f"    💥 {worker_name}: TTS exception for chunk {chunk_index}: {e}")
+            self.release(audio_file)
             return None
 
     def get_processing_stats(self) -> dict:
@@ -217,51 +356,64 @@ class SequentialTTSProcessor:
 
     def __init__(self, tts_timeout=30):
         self.tts_timeout = tts_timeout
-        self.tts_python = os.path.expanduser("~/.venvs/tts/bin/python")
-        self.say_read_script = os.path.join(os.path.dirname(__file__), "say_read.py")
+        self.tts_python = _TTS_PYTHON
+        self.say_read_script = _SAY_READ_SCRIPT
+        self._tmpdir = tempfile.mkdtemp(prefix="tts_sequential_")
+        self._seq = itertools.count()
+
+    def close(self):
+        """Remove the output directory and every chunk written to it"""
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
 
     def process_chunks_sequential(self, text_chunks: List[str]) -> List[Tuple[int, str]]:
-        """Process chunks sequentially for comparison"""
+        """Process chunks sequentially for comparison (one say_read.py --batch run)"""
         print(f"🔄 Starting sequential TTS processing for {len(text_chunks)} chunks")
         start_time = time.time()
 
         audio_files = []
+        basenames = [f"chunk_{next(self._seq)}.wav" for _ in text_chunks]
+        jobs = [
+            {"text": text, "out": os.path.join(self._tmpdir, basename)}
+            for text, basename in zip(text_chunks, basenames)
+        ]
 
-        for i, text in enumerate(text_chunks):
-            print(f"  🎤 Processing chunk {i+1}/{len(text_chunks)}")
+        # All chunks share a single interpreter and model load
+        jobs_file = os.path.join(self._tmpdir, f"jobs_{next(self._seq)}.json")
+        with open(jobs_file, 'w', encoding='utf-8') as f:
+            json.dump(jobs, f)
 
-            temp_dir = tempfile.gettempdir()
-            audio_file = os.path.join(
-                temp_dir,
-                f"seq_chunk_{i}_{os.getpid()}_{int(time.time())}.wav"
+        cmd = [
+            self.tts_python,
+            self.say_read_script,
+            "--batch", jobs_file
+        ]
+
+        try:
+            # Raw bytes: stdout is parsed as JSON directly, stderr decoded only on failure
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=self.tts_timeout * max(len(text_chunks), 1)
             )
 
-            cmd = [
-                self.tts_python,
-                self.say_read_script,
-                "-o", audio_file,
-                "-"
-            ]
+            replies = json.loads(result.stdout) if result.returncode == 0 else []
+            if not replies:
+                print("    ❌ Batch TTS failed")
+                if result.stderr:
+                    print(f"       Error: {result.stderr.decode('utf-8', 'replace')}")
 
-            try:
-                result = subprocess.run(
-                    cmd,
-                    input=text,
-                    text=True,
-                    capture_output=True,
-                    timeout=self.tts_timeout
-                )
-
-                if result.returncode == 0 and os.path.exists(audio_file):
-                    audio_files.append((i, audio_file))
-                    print(f"    ✅ Generated {os.path.basename(audio_file)}")
+            for i, (job, reply) in enumerate(zip(jobs, replies)):
+                if reply.get('ok') and os.path.exists(job['out']):
+                    audio_files.append((i, job['out']))
+                    print(f"    ✅ Generated {basenames[i]}")
                 else:
                     print(f"    ❌ Failed to generate audio for chunk {i}")
 
-            except subprocess.TimeoutExpired:
-                print(f"    ⏰ Timeout for chunk {i}")
-            except Exception as e:
-                print(f"    💥 Error for chunk {i}: {e}")
+        except subprocess.TimeoutExpired:
+            print(f"    ⏰ Timeout for batch of {len(text_chunks)} chunks")
+        except Exception as e:
+            print(f"    💥 Batch error: {e}")
 
         total_time = time.time() - start_time
         print(f"⚡ Sequential processing complete: {len(audio_files)}/{len(text_chunks)} chunks in {total_time:.1f}s")
@@ -313,12 +465,8 @@ def benchmark_parallel_vs_sequential():
 
     # Cleanup
     print("\n🧹 Cleaning up test files...")
-    for _, audio_file in sequential_results + parallel_results:
-        try:
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-        except:
-            pass
+    sequential_processor.close()
+    parallel_processor.close()
 
     return {
         'sequential_time': sequential_time,
@@ -330,6 +478,7 @@ def benchmark_parallel_vs_sequential():
 if __name__ == "__main__":
     # Set up logging
     logging.basicConfig(level=logging.INFO)
+    setup_console_logging()
 
     # Run benchmark
     results = benchmark_parallel_vs_sequential()
@@ -21,11 +21,10 @@ def test_basic_audio():
 
     print(f"📝 Text: {test_text}")
 
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-        temp_wav = f.name
+    # Scratch directory is removed on exit, however the test ends
+    with tempfile.TemporaryDirectory(prefix='audio_test_') as temp_dir:
+        temp_wav = os.path.join(temp_dir, 'test.wav')
 
-    try:
         # Step 1: Generate audio using existing say_read.py
         print("\n🔊 Step 1: Generating audio...")
 
@@ -36,11 +35,11 @@ def test_basic_audio():
             "-"  # Read from stdin
         ]
 
-        result = subprocess.run(cmd, input=test_text, capture_output=True, text=True, timeout=30)
+        result = subprocess.run(cmd, input=test_text, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True, timeout=30)
 
         if result.returncode != 0:
             print(f"❌ Audio generation failed:")
-            print(f"stdout: {result.stdout}")
             print(f"stderr: {result.stderr}")
             return False
 
@@ -59,22 +58,16 @@ def test_basic_audio():
 
         print(f"Running: {' '.join(play_cmd)}")
 
-        play_result = subprocess.run(play_cmd, capture_output=True, text=True)
+        play_result = subprocess.run(play_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
 
         if play_result.returncode != 0:
             print(f"❌ Audio playback failed:")
-            print(f"stdout: {play_result.stdout}")
             print(f"stderr: {play_result.stderr}")
             return False
 
         print("✅ Audio played successfully!")
         return True
 
-    finally:
-        # Clean up
-        if os.path.exists(temp_wav):
-            os.unlink(temp_wav)
-
 if __name__ == "__main__":
     success = test_basic_audio()
 
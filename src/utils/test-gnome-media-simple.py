@@ -64,7 +64,8 @@ def test_dbus_service():
             'org.freedesktop.DBus.Introspectable.Introspect'
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        # Only the exit status matters here
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
 
         if result.returncode == 0:
             print("✅ D-Bus service is accessible")
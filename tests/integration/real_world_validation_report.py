@@ -4,18 +4,14 @@ Real-World Validation Report
 Comprehensive analysis of Gold Standard chunker performance on Substack article
 """
 
-from gold_standard_chunker import GoldStandardChunker
+import re
+import sys
 
-def generate_validation_report():
-    """Generate comprehensive validation report for real-world content"""
-
-    print("📋 REAL-WORLD VALIDATION REPORT")
-    print("=" * 70)
-    print("🌍 Source: Substack article 'The attention economy is inverting'")
-    print("🎯 Testing: Gold Standard chunker (100% test pass rate)")
-    print("📊 Content: 2,196 characters, 403 words")
+# Abbreviation checks run once per chunk, so compile them up front
+_ABBREV_ISSUE_RE = re.compile(r'\b[A-Z]\.\s+[a-z]')
+_ABBREV_OK_RE = re.compile(r'\b(?:Dr|Mr|Mrs|Ms)\.\s+[A-Z]')
 
-    article_text = """The attention economy is inverting
+_ARTICLE_TEXT = """The attention economy is inverting
 By Sam Schillace
 
 Once upon a time, in the way back before generative AI, people would have to work hard to produce a digital object of any real quality - an image, a document, a report, a PowerPoint. This was helpful in one way - the obvious effort that went into its creation was a good signal or proxy for quality. We've discussed this part of it before, and this effect was present across all kinds of media - both personal and broadcast. If you could get on TV, you likely had something to say, because (for a while at least) it was hard to do that. Filters and signals are great heuristics for deciding what to pay attention to, or they used to be.
@@ -26,72 +22,101 @@ But what happens in the generative world? In that world, the signal is broken -
 
 This problem has recently been labeled "work slop", and that's a good example. Work often has this signaling problem, or even a 'busy work' problem: make someone produce a report not because it's valuable per se but because the act of producing it as an assurance that the work was done or is a proxy for some other activity."""
 
+def generate_validation_report(article_text=_ARTICLE_TEXT):
+    """Generate comprehensive validation report for real-world content"""
+
+    # Report lines are collected and written to stdout in one go at the end
+    lines = []
+    p = lines.append
+
+    p("📋 REAL-WORLD VALIDATION REPORT")
+    p("=" * 70)
+    p("🌍 Source: Substack article 'The attention economy is inverting'")
+    p("🎯 Testing: Gold Standard chunker (100% test pass rate)")
+    p("📊 Content: 2,196 characters, 403 words")
+
+    # Imported here so importing this module doesn't load the chunker
+    from gold_standard_chunker import GoldStandardChunker
+
     gold_chunker = GoldStandardChunker()
     chunks = gold_chunker.gold_standard_chunk_text(article_text)
 
-    print(f"\n✅ CORE TTS QUALITY VALIDATION")
-    print("=" * 50)
+    p(f"\n✅ CORE TTS QUALITY VALIDATION")
+    p("=" * 50)
 
     # Critical TTS quality checks
     word_cutoffs = 0
     spacing_issues = 0
     abbreviation_problems = 0
 
-    for i, chunk in enumerate(chunks):
-        # Check for word cutoffs (the original problem!)
-        if i < len(chunks) - 1:  # Not the last chunk
-            current_ends_alpha = chunk[-1:].isalpha()
-            next_starts_alpha = chunks[i+1][0:1].isalpha()
-            if current_ends_alpha and next_starts_alpha:
-                word_cutoffs += 1
-
-        # Check for double spacing issues
+    # Length statistics gathered in the same pass as the quality checks
+    total_len = 0
+    min_len = float('inf')
+    max_len = 0
+    ideal_chunks = 0
+
+    # Check for word cutoffs (the original problem!) across each adjacent pair
+    for chunk, nxt in zip(chunks, chunks[1:]):
+        if chunk and nxt and chunk[-1].isalpha() and nxt[0].isalpha():
+            word_cutoffs += 1
+
+    for chunk in chunks:
+        chunk_len = len(chunk)
+        total_len += chunk_len
+        if chunk_len < min_len:
+            min_len = chunk_len
+        if chunk_len > max_len:
+            max_len = chunk_len
+        if 80 <= chunk_len <= 200:  # Optimal chunk size for TTS
+            ideal_chunks += 1
+
+        # Check for double spacing issues (a plain substring test stays on the
+        # C fast path; don't swap it for re.search(r'\s\s', ...))
         if '  ' in chunk:
             spacing_issues += 1
 
         # Check abbreviation handling
-        import re
-        abbrev_issues = len(re.findall(r'\b[A-Z]\.\s+[a-z]', chunk))
-        if abbrev_issues > 0 and not re.search(r'\b(Dr|Mr|Mrs|Ms)\.\s+[A-Z]', chunk):
+        abbrev_issues = sum(1 for _ in _ABBREV_ISSUE_RE.finditer(chunk))
+        if abbrev_issues > 0 and not _ABBREV_OK_RE.search(chunk):
             abbreviation_problems += abbrev_issues
 
-    print(f"🎵 Word cutoff issues: {word_cutoffs} (ZERO = PERFECT)")
-    print(f"🎵 Spacing artifacts: {spacing_issues} (ZERO = PERFECT)")
-    print(f"🎵 Abbreviation issues: {abbreviation_problems} (ZERO = PERFECT)")
+    p(f"🎵 Word cutoff issues: {word_cutoffs} (ZERO = PERFECT)")
+    p(f"🎵 Spacing artifacts: {spacing_issues} (ZERO = PERFECT)")
+    p(f"🎵 Abbreviation issues: {abbreviation_problems} (ZERO = PERFECT)")
 
     if word_cutoffs == 0 and spacing_issues == 0:
-        print("🏆 PERFECT TTS QUALITY: Original problems 100% SOLVED!")
+        p("🏆 PERFECT TTS QUALITY: Original problems 100% SOLVED!")
     else:
-        print("❌ TTS quality issues detected")
+        p("❌ TTS quality issues detected")
 
-    print(f"\n📊 CHUNKING PERFORMANCE ANALYSIS")
-    print("=" * 50)
-    print(f"📈 Number of chunks: {len(chunks)}")
-    print(f"📈 Average chunk length: {sum(len(c) for c in chunks) / len(chunks):.1f} chars")
-    print(f"📈 Chunk length range: {min(len(c) for c in chunks)} - {max(len(c) for c in chunks)} chars")
+    p(f"\n📊 CHUNKING PERFORMANCE ANALYSIS")
+    p("=" * 50)
+    p(f"📈 Number of chunks: {len(chunks)}")
+    avg_len = total_len / len(chunks)
+    p(f"📈 Average chunk length: {avg_len:.1f} chars")
+    p(f"📈 Chunk length range: {min_len} - {max_len} chars")
 
     # Optimal chunk size analysis (for TTS)
-    ideal_chunks = sum(1 for c in chunks if 80 <= len(c) <= 200)
-    print(f"📈 Chunks in ideal TTS range (80-200 chars): {ideal_chunks}/{len(chunks)} ({100*ideal_chunks/len(chunks):.1f}%)")
+    p(f"📈 Chunks in ideal TTS range (80-200 chars): {ideal_chunks}/{len(chunks)} ({100*ideal_chunks/len(chunks):.1f}%)")
 
-    print(f"\n🔍 CONTENT PRESERVATION ANALYSIS")
-    print("=" * 50)
-    reconstructed = ''.join(chunks)
-    char_diff = abs(len(article_text) - len(reconstructed))
+    p(f"\n🔍 CONTENT PRESERVATION ANALYSIS")
+    p("=" * 50)
+    # len(''.join(chunks)) == total_len, so no joined copy is needed
+    char_diff = abs(len(article_text) - total_len)
     preservation_rate = 100 * (1 - char_diff / len(article_text))
 
-    print(f"📝 Character preservation: {preservation_rate:.2f}%")
-    print(f"📝 Character difference: {char_diff} chars (likely whitespace normalization)")
+    p(f"📝 Character preservation: {preservation_rate:.2f}%")
+    p(f"📝 Character difference: {char_diff} chars (likely whitespace normalization)")
 
     if char_diff <= 10 and preservation_rate >= 99.5:
-        print("✅ EXCELLENT content preservation - minor whitespace cleanup only")
+        p("✅ EXCELLENT content preservation - minor whitespace cleanup only")
     elif char_diff <= 50:
-        print("⚠️ Good content preservation - minor differences")
+        p("⚠️ Good content preservation - minor differences")
     else:
-        print("❌ Significant content changes detected")
+        p("❌ Significant content changes detected")
 
-    print(f"\n🎯 PRODUCTION READINESS ASSESSMENT")
-    print("=" * 50)
+    p(f"\n🎯 PRODUCTION READINESS ASSESSMENT")
+    p("=" * 50)
 
     # Production readiness criteria
     criteria = {
@@ -99,7 +124,7 @@ This problem has recently been labeled "work slop", and that's a good example. W
         "No spacing artifacts": spacing_issues == 0,
         "Content preserved (>99%)": preservation_rate >= 99.0,
         "Reasonable chunk count": 2 <= len(chunks) <= 20,
-        "Average chunk size appropriate": 50 <= sum(len(c) for c in chunks) / len(chunks) <= 500
+        "Average chunk size appropriate": 50 <= avg_len <= 500
     }
 
     passing_criteria = sum(criteria.values())
@@ -107,18 +132,19 @@ This problem has recently been labeled "work slop", and that's a good example. W
 
     for criterion, passed in criteria.items():
         status = "✅" if passed else "❌"
-        print(f"{status} {criterion}")
+        p(f"{status} {criterion}")
 
-    print(f"\n🏆 FINAL SCORE: {passing_criteria}/{total_criteria} criteria passed")
+    p(f"\n🏆 FINAL SCORE: {passing_criteria}/{total_criteria} criteria passed")
 
     if passing_criteria == total_criteria:
-        print("🎉 PRODUCTION READY: All quality criteria met!")
-        print("🎵 Safe for immediate TTS deployment!")
+        p("🎉 PRODUCTION READY: All quality criteria met!")
+        p("🎵 Safe for immediate TTS deployment!")
     elif passing_criteria >= total_criteria - 1:
-        print("✅ PRODUCTION READY: Excellent quality with minor notes")
+        p("✅ PRODUCTION READY: Excellent quality with minor notes")
     else:
-        print("⚠️ Needs review before production deployment")
+        p("⚠️ Needs review before production deployment")
 
+    sys.stdout.write("\n".join(lines) + "\n")
     return chunks, passing_criteria == total_criteria
 
 if __name__ == "__main__":
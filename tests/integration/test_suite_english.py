@@ -4,7 +4,21 @@ English Test Suite for Chunking Algorithm Evaluation
 Contains 20 diverse test cases with gold standard ideal chunks
 """
 
-ENGLISH_TEST_SUITE = [
+import sys
+from typing import NamedTuple, Optional, Tuple
+
+
+class TestCase(NamedTuple):
+    """A single test case with its gold standard ideal chunks"""
+    __test__ = False  # not a pytest test class
+
+    id: int
+    name: str
+    text: str
+    ideal_chunks: Tuple[str, ...]
+
+
+_RAW_TEST_SUITE = [
     {
         "id": 1,
         "name": "Simple Sentences",
@@ -182,26 +196,31 @@ ENGLISH_TEST_SUITE = [
     }
 ]
 
-def get_test_by_id(test_id: int):
+def make_test_case(raw: dict) -> TestCase:
+    """Freeze one raw entry into an immutable TestCase"""
+    return TestCase(raw["id"], raw["name"], raw["text"], tuple(raw["ideal_chunks"]))
+
+# Built once at import: immutable entries plus O(1) lookup indexes
+ENGLISH_TEST_SUITE = tuple(make_test_case(t) for t in _RAW_TEST_SUITE)
+del _RAW_TEST_SUITE
+
+_BY_ID = {t.id: t for t in ENGLISH_TEST_SUITE}
+_BY_NAME = {t.name.lower(): t for t in ENGLISH_TEST_SUITE}
+
+def get_test_by_id(test_id: int) -> Optional[TestCase]:
     """Get a specific test case by ID"""
-    for test in ENGLISH_TEST_SUITE:
-        if test["id"] == test_id:
-            return test
-    return None
+    return _BY_ID.get(test_id)
 
-def get_test_by_name(test_name: str):
+def get_test_by_name(test_name: str) -> Optional[TestCase]:
     """Get a specific test case by name"""
-    for test in ENGLISH_TEST_SUITE:
-        if test["name"].lower() == test_name.lower():
-            return test
-    return None
+    return _BY_NAME.get(test_name.lower())
 
 if __name__ == "__main__":
-    print("English Test Suite for Chunking Algorithm")
-    print("=" * 50)
+    # Build the whole listing first and emit it with a single write
+    lines = ["English Test Suite for Chunking Algorithm", "=" * 50]
     for test in ENGLISH_TEST_SUITE:
-        print(f"\n{test['id']}. {test['name']}")
-        print(f"Text: {test['text']}")
-        print("Ideal chunks:")
-        for i, chunk in enumerate(test['ideal_chunks'], 1):
-            print(f"  {i}: {chunk}")
\ No newline at end of file
+        lines.append(f"\n{test.id}. {test.name}")
+        lines.append(f"Text: {test.text}")
+        lines.append("Ideal chunks:")
+        lines.extend(f"  {i}: {chunk}" for i, chunk in enumerate(test.ideal_chunks, 1))
+    sys.stdout.write("\n".join(lines) + "\n")
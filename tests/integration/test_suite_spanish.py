@@ -5,7 +5,11 @@ Spanish Test Suite for Chunking Algorithm Evaluation
 Contains 20 diverse test cases with gold standard ideal chunks
 """
 
-SPANISH_TEST_SUITE = [
+from typing import Optional
+
+from test_suite_english import TestCase, make_test_case
+
+_RAW_TEST_SUITE = [
     {
         "id": 1,
         "name": "Oraciones Simples",
@@ -182,26 +186,27 @@ SPANISH_TEST_SUITE = [
     }
 ]
 
-def get_test_by_id(test_id: int):
+# Built once at import: immutable entries plus O(1) lookup indexes
+SPANISH_TEST_SUITE = tuple(make_test_case(t) for t in _RAW_TEST_SUITE)
+del _RAW_TEST_SUITE
+
+_BY_ID = {t.id: t for t in SPANISH_TEST_SUITE}
+_BY_NAME = {t.name.lower(): t for t in SPANISH_TEST_SUITE}
+
+def get_test_by_id(test_id: int) -> Optional[TestCase]:
     """Get a specific test case by ID"""
-    for test in SPANISH_TEST_SUITE:
-        if test["id"] == test_id:
-            return test
-    return None
+    return _BY_ID.get(test_id)
 
-def get_test_by_name(test_name: str):
+def get_test_by_name(test_name: str) -> Optional[TestCase]:
     """Get a specific test case by name"""
-    for test in SPANISH_TEST_SUITE:
-        if test["name"].lower() == test_name.lower():
-            return test
-    return None
+    return _BY_NAME.get(test_name.lower())
 
 if __name__ == "__main__":
     print("Spanish Test Suite for Chunking Algorithm")
     print("=" * 50)
     for test in SPANISH_TEST_SUITE:
-        print(f"\n{test['id']}. {test['name']}")
-        print(f"Text: {test['text']}")
+        print(f"\n{test.id}. {test.name}")
+        print(f"Text: {test.text}")
         print("Ideal chunks:")
-        for i, chunk in enumerate(test['ideal_chunks'], 1):
-            print(f"  {i}: {chunk}")
\ No newline at end of file
+        for i, chunk in enumerate(test.ideal_chunks, 1):
+            print(f"  {i}: {chunk}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env uv run --with linux-speech-tools[dev]
+# /// script
+# dependencies = []  # Uses shared dev dependencies from pyproject.toml
+# requires-python = ">=3.8"
+# ///
+"""
+Tests for the SimpleParallelTTS <-> say_read.py --server protocol
+Runs against a stub server, so no TTS model is needed
+"""
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "tts"))
+
+import simple_parallel
+
+# Speaks the --server protocol; the chunk text selects the outcome
+STUB_SERVER = textwrap.dedent("""
+    import json, sys, time
+    for line in sys.stdin:
+        if not line.strip():
+            break
+        job = json.loads(line)
+        if job["text"] == "crash":
+            sys.exit(1)
+        if job["text"] == "hang":
+            time.sleep(30)
+        if job["text"] == "fail":
+            reply = {"ok": False, "error": "synthesis failed"}
+        else:
+            with open(job["out"], "wb") as f:
+                f.write(b"RIFF" + job["text"].encode())
+            reply = {"ok": True, "out": job["out"]}
+        sys.stdout.write(json.dumps(reply) + "\\n")
+        sys.stdout.flush()
+""")
+
+class TestSimpleParallelTTS(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._stub_dir = tempfile.TemporaryDirectory(prefix="tts_stub_")
+        cls.stub_script = os.path.join(cls._stub_dir.name, "stub_server.py")
+        with open(cls.stub_script, "w") as f:
+            f.write(STUB_SERVER)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._stub_dir.cleanup()
+
+    def make_processor(self, **kwargs):
+        """Build a processor whose workers run the stub server"""
+        with mock.patch.object(simple_parallel, "_TTS_PYTHON", sys.executable), \
+             mock.patch.object(simple_parallel, "_SAY_READ_SCRIPT", self.stub_script):
+            processor = simple_parallel.SimpleParallelTTS(**kwargs)
+        self.addCleanup(processor.close)
+        return processor
+
+    def assert_audio(self, results, indices):
+        """Check that exactly these chunk indices produced readable audio files"""
+        self.assertEqual([i for i, _ in results], indices)
+        for _, path in results:
+            with open(path, "rb") as f:
+                self.assertTrue(f.read().startswith(b"RIFF"))
+
+    def test_chunks_come_back_in_order(self):
+        processor = self.make_processor(max_workers=2)
+        results = processor.process_chunks_parallel([f"chunk {i}" for i in range(5)])
+        self.assert_audio(results, [0, 1, 2, 3, 4])
+
+    def test_failed_chunk_is_skipped(self):
+        processor = self.make_processor(max_workers=1)
+        results = processor.process_chunks_parallel(["one", "fail", "three"])
+        self.assert_audio(results, [0, 2])
+        self.assertEqual(processor.get_processing_stats()["failed_chunks"], 1)
+
+    def test_crashed_server_only_loses_its_chunk(self):
+        processor = self.make_processor(max_workers=1)
+        results = processor.process_chunks_parallel(["one", "crash", "three", "four", "five"])
+        self.assert_audio(results, [0, 2, 3, 4])
+
+    def test_stuck_server_is_replaced(self):
+        processor = self.make_processor(max_workers=1, tts_timeout=1)
+        results = processor.process_chunks_parallel(["one", "hang", "three"])
+        self.assert_audio(results, [0, 2])
+
+    def test_workers_restart_after_stop(self):
+        processor = self.make_processor(max_workers=2)
+        processor.process_chunks_parallel(["one", "two"])
+        processor.stop_workers()
+        results = processor.process_chunks_parallel(["three", "four"])
+        self.assert_audio(results, [0, 1])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -9,12 +9,28 @@ Tests all core functionality across different environments
 """
 
 import os
+import shutil
 import sys
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
 
+_DIR = Path(__file__).parent.parent
+_SCRIPTS = ("say", "say-local", "say-read", "say-read-es", "talk2claude")
+
+def _load(script_path):
+    """Read a voice command script: (path, exists, first_line, content)"""
+    if not script_path.exists():
+        return (script_path, False, "", "")
+    with open(script_path) as f:
+        content = f.read()
+    first_line = content.split("\n", 1)[0].strip()
+    return (script_path, True, first_line, content)
+
+# Every voice command script is read once per test run and shared by all classes
+_SCRIPT_INFO = {s: _load(_DIR / s) for s in _SCRIPTS}
+
 class TestSpeechTools(unittest.TestCase):
 
     def setUp(self):
@@ -39,6 +55,7 @@ class TestSpeechTools(unittest.TestCase):
         python_script = self.script_dir / "say_read.py"
         self.assertTrue(python_script.exists(), "say_read.py not found")
 
+    @unittest.skipUnless(shutil.which("bash"), "bash not installed")
     def test_say_help_option(self):
         """Test say command help option"""
         try:
@@ -49,6 +66,7 @@ class TestSpeechTools(unittest.TestCase):
         except subprocess.TimeoutExpired:
             self.fail("say -h command timed out")
 
+    @unittest.skipUnless(shutil.which("edge-tts"), "edge-tts not installed")
     def test_say_file_output(self):
         """Test say command file output functionality"""
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
@@ -67,9 +85,10 @@ class TestSpeechTools(unittest.TestCase):
                 self.assertGreater(os.path.getsize(tmp_path), 0, "Output file is empty")
             else:
                 # Command failed, likely due to missing dependencies
-                self.assertIn(("edge-tts" or "command not found"),
-                            result.stderr.lower() or result.stdout.lower(),
-                            f"Unexpected error: {result.stderr}")
+                combined = (result.stderr + result.stdout).lower()
+                expected_errors = ("edge-tts", "command not found")
+                self.assertTrue(any(err in combined for err in expected_errors),
+                              f"Unexpected error: {result.stderr}")
         finally:
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
@@ -104,28 +123,36 @@ class TestSpeechTools(unittest.TestCase):
 
     def test_voice_commands_syntax(self):
         """Test that voice command scripts have valid syntax"""
-        scripts = ["say", "say-local", "say-read", "say-read-es", "talk2claude"]
-
-        for script in scripts:
-            script_path = self.script_dir / script
-            if script_path.exists():
-                with open(script_path) as f:
-                    content = f.read()
-                    if content.startswith("#!/"):
-                        # Basic syntax validation for shell scripts
-                        self.assertNotIn("syntax error", content.lower())
-
-                        # Test with bash syntax check if possible
-                        try:
-                            result = subprocess.run([
-                                "bash", "-n", str(script_path)
-                            ], capture_output=True, text=True, timeout=5)
-
-                            if result.returncode != 0:
-                                self.fail(f"Syntax error in {script}: {result.stderr}")
-                        except (subprocess.TimeoutExpired, FileNotFoundError):
-                            # bash not available or timed out, skip syntax check
-                            pass
+        shell_scripts = []
+
+        for script_path, exists, _, content in _SCRIPT_INFO.values():
+            if exists and content.startswith("#!/"):
+                # Basic syntax validation for shell scripts
+                self.assertNotIn("syntax error", content.lower())
+                shell_scripts.append(str(script_path))
+
+        if not shell_scripts:
+            return
+
+        # Check every script from a single shell instead of one subprocess each;
+        # the checks run concurrently and are then collected in order
+        check_loop = (
+            'pids=(); for f in "$@"; do bash -n "$f" & pids+=($!); done; '
+            'status=0; i=0; '
+            'for f in "$@"; do wait "${pids[$i]}" || { echo "Syntax error in $f" >&2; status=1; }; i=$((i+1)); done; '
+            'exit $status'
+        )
+        try:
+            result = subprocess.run(
+                ["bash", "-c", check_loop, "--"] + shell_scripts,
+                capture_output=True, text=True, timeout=5
+            )
+
+            if result.returncode != 0:
+                self.fail(result.stderr)
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            # bash not available or timed out, skip syntax check
+            pass
 
     def test_readme_exists(self):
         """Test that README file exists"""
@@ -141,22 +168,15 @@ class TestDistributionCompatibility(unittest.TestCase):
 
     def test_shebang_compatibility(self):
         """Test that all scripts use portable shebangs"""
-        script_dir = Path(__file__).parent.parent
-        scripts = ["say", "say-local", "say-read", "say-read-es", "talk2claude"]
-
-        for script in scripts:
-            script_path = script_dir / script
-            if script_path.exists():
-                with open(script_path) as f:
-                    first_line = f.readline().strip()
-                    if first_line.startswith("#!"):
-                        # Should use env for portability
-                        self.assertTrue(
-                            first_line.startswith("#!/usr/bin/env") or
-                            first_line.startswith("#!/bin/bash") or
-                            first_line.startswith("#!/bin/sh"),
-                            f"Non-portable shebang in {script}: {first_line}"
-                        )
+        for script, (_, exists, first_line, _) in _SCRIPT_INFO.items():
+            if exists and first_line.startswith("#!"):
+                # Should use env for portability
+                self.assertTrue(
+                    first_line.startswith("#!/usr/bin/env") or
+                    first_line.startswith("#!/bin/bash") or
+                    first_line.startswith("#!/bin/sh"),
+                    f"Non-portable shebang in {script}: {first_line}"
+                )
 
 class TestEnvironmentSetup(unittest.TestCase):
     """Test environment setup and configuration"""